@@ -7,11 +7,15 @@ Update AWBC/SRBC prompts and fuse summaries/interpretations in multi-sheet Excel
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+import os
 from pathlib import Path
 import re
-from typing import List, Optional, Sequence, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
-from openpyxl import load_workbook
+from openpyxl import Workbook, load_workbook
 
 
 AWBC_CONFIG_V1 = {
@@ -139,127 +143,149 @@ CONFIG_PROFILES = {
 
 NEUTRAL_PHRASES = ["无明显异常", "正常范围", "未见明显异常"]
 
-ENGLISH_REPLACEMENTS: List[Tuple[re.Pattern, str]] = [
-    (re.compile(r"\bHematology System abnormalities\b", re.IGNORECASE), "hematological abnormalities"),
-    (re.compile(r"\banti[- ]?metabolic\b", re.IGNORECASE), "antimetabolite"),
-    (re.compile(r"\batypical granulocytes\s*\(ALY#\)", re.IGNORECASE), "atypical lymphocytes (ALY#)"),
-    (re.compile(r"\bimmature granulocytes\s*\(ALY#\)", re.IGNORECASE), "atypical lymphocytes (ALY#)"),
-    (re.compile(r"\bgranulocytes\s*\(ALY#\)", re.IGNORECASE), "atypical lymphocytes (ALY#)"),
+# Single-pass equivalent of replacing "。；" with "；" and then "；；" with "；"
+CLEANUP_PATTERN = re.compile(r"(?:。?；){2}|。；")
+
+ENGLISH_REPLACEMENTS: List[Tuple[str, str, str]] = [
+    ("hematology", r"\bHematology System abnormalities\b", "hematological abnormalities"),
+    ("antimetabolite", r"\banti[- ]?metabolic\b", "antimetabolite"),
+    ("atypical_gran", r"\batypical granulocytes\s*\(ALY#\)", "atypical lymphocytes (ALY#)"),
+    ("immature_gran", r"\bimmature granulocytes\s*\(ALY#\)", "atypical lymphocytes (ALY#)"),
+    ("gran", r"\bgranulocytes\s*\(ALY#\)", "atypical lymphocytes (ALY#)"),
+    # e.g. variants allow arbitrary whitespace and case, so they stay in the fused
+    # regex (no extra pass) rather than a finite str.replace table.
+    ("eg_comma", r"\be\s*\.\s*g\s*\.\s*,", "e.g.,"),
+    ("eg", r"\be\s*\.\s*g\s*\.\b", "e.g."),
 ]
 
 ALY_ADJECTIVES = r"(?:abnormal|atypical|unclassified|immature|degenerated|reactive|early)"
 ALY_TARGET = r"(?:granulocytes?|white\s+blood\s+cells?|wbc(?:s)?|monocytes?|nucleated\s+cells?|cells?|components?)"
-ALY_FIXES: List[Tuple[re.Pattern, str]] = [
+# Optional adjective run; the lookahead + backreference pair emulates an atomic
+# group so a failed match never backtracks through the adjective list.
+ALY_ADJECTIVE_RUN = r"(?=(?P<{name}>(?:" + ALY_ADJECTIVES + r"\s+)*))(?P={name})"
+ALY_FIXES: List[Tuple[str, str, str]] = [
     (
-        re.compile(
-            rf"\b(ALY#?)\s*\(\s*{ALY_ADJECTIVES}(?:\s+{ALY_ADJECTIVES})*\s+{ALY_TARGET}\s*\)",
-            re.IGNORECASE,
-        ),
-        r"\1 (atypical lymphocytes)",
-    ),
-    (
-        re.compile(
-            rf"\b(ALY#?)\s*\(\s*{ALY_TARGET}\s*\)",
-            re.IGNORECASE,
-        ),
-        r"\1 (atypical lymphocytes)",
-    ),
-    (
-        re.compile(
-            rf"\b{ALY_ADJECTIVES}(?:\s+{ALY_ADJECTIVES})*\s+{ALY_TARGET}\s*\(\s*(ALY#?)\s*\)",
-            re.IGNORECASE,
-        ),
-        r"atypical lymphocytes (\1)",
+        "aly_first",
+        rf"\b(?P<aly_first_token>ALY#?)\s*\(\s*"
+        + ALY_ADJECTIVE_RUN.format(name="aly_first_adjectives")
+        + rf"{ALY_TARGET}\s*\)",
+        r"\g<aly_first_token> (atypical lymphocytes)",
     ),
     (
-        re.compile(
-            rf"\b{ALY_TARGET}\s*\(\s*(ALY#?)\s*\)",
-            re.IGNORECASE,
-        ),
-        r"atypical lymphocytes (\1)",
+        "aly_last",
+        r"\b"
+        + ALY_ADJECTIVE_RUN.format(name="aly_last_adjectives")
+        + rf"{ALY_TARGET}\s*\(\s*(?P<aly_last_token>ALY#?)\s*\)",
+        r"atypical lymphocytes (\g<aly_last_token>)",
     ),
 ]
 
 
+# Fuse (name, pattern, replacement) rules into one regex so each cell is scanned once.
+def compile_alternation(rules: Sequence[Tuple[str, str, str]]) -> Tuple[re.Pattern, Callable]:
+    pattern = re.compile(
+        "|".join(f"(?P<{name}>{regex})" for name, regex, _ in rules),
+        re.IGNORECASE,
+    )
+    replacements = {name: replacement for name, _, replacement in rules}
+
+    def replace(match: re.Match) -> str:
+        return match.expand(replacements[match.lastgroup])
+
+    return pattern, replace
+
+
+ENGLISH_PATTERN, _replace_english = compile_alternation(ENGLISH_REPLACEMENTS)
+# Every ENGLISH_REPLACEMENTS rule requires one of these literals (casefolded);
+# "." covers the whitespace-tolerant e.g. patterns.
+ENGLISH_NEEDLES = ("hematology", "metabolic", "granulocyte", ".")
+ALY_PATTERN, _replace_aly = compile_alternation(ALY_FIXES)
+
+
+@lru_cache(maxsize=None)
+def keyword_matcher(keywords: Tuple[str, ...]) -> Callable:
+    # One compiled alternation per keyword set: a single scan finds any keyword
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords)).search
+
+
 def contains_any(text: str, keywords: Sequence[str]) -> bool:
-    if not text:
+    if not text or not keywords:
         return False
-    return any(keyword in text for keyword in keywords)
+    return keyword_matcher(tuple(keywords))(text) is not None
 
 
 def cleanup(text: str) -> str:
-    if not text:
+    if not text or "；" not in text:
         return text
-    return text.replace("。；", "；").replace("；；", "；")
+    return CLEANUP_PATTERN.sub("；", text)
 
 
 def cleanup_english(text: str) -> str:
     if not text:
         return text
-    value = text
-    for pattern, replacement in ENGLISH_REPLACEMENTS:
-        value = pattern.sub(replacement, value)
-    value = re.sub(r"\be\s*\.\s*g\s*\.\s*,", "e.g.,", value, flags=re.IGNORECASE)
-    value = re.sub(r"\be\s*\.\s*g\s*\.\b", "e.g.", value, flags=re.IGNORECASE)
-    return value
+    lowered = text.casefold()
+    if not any(needle in lowered for needle in ENGLISH_NEEDLES):
+        return text
+    return ENGLISH_PATTERN.sub(_replace_english, text)
+
 
+def map_text_cells(rows: Iterable[Sequence], transform: Callable[[str], str]) -> Iterator[Sequence]:
+    # Rows are only copied when a cell actually changes; untouched rows pass through.
+    # Sheets repeat the same texts heavily, so each distinct value is transformed once.
+    transform = lru_cache(maxsize=8192)(transform)
+    for row in rows:
+        updated = None
+        for index, value in enumerate(row):
+            if isinstance(value, str):
+                cleaned = transform(value)
+                if cleaned != value:
+                    if updated is None:
+                        updated = list(row)
+                    updated[index] = cleaned
+        yield row if updated is None else updated
 
-def cleanup_english_sheet(ws) -> None:
-    for row in ws.iter_rows():
-        for cell in row:
-            if isinstance(cell.value, str):
-                cleaned = cleanup_english(cell.value)
-                if cleaned != cell.value:
-                    cell.value = cleaned
+
+def cleanup_english_sheet(rows: Iterable[Sequence]) -> Iterator[Sequence]:
+    return map_text_cells(rows, cleanup_english)
 
 
 def fix_aly_descriptions(text: str) -> str:
-    if not text or "ALY" not in text.upper():
+    # Every ALY_FIXES rule needs a literal "(", so most cells skip the upper() copy
+    if not text or "(" not in text or "ALY" not in text.upper():
         return text
-    value = text
-    for pattern, replacement in ALY_FIXES:
-        value = pattern.sub(replacement, value)
-    return value
+    return ALY_PATTERN.sub(_replace_aly, text)
 
 
-def fix_aly_sheet(ws) -> None:
-    for row in ws.iter_rows():
-        for cell in row:
-            if isinstance(cell.value, str):
-                cleaned = fix_aly_descriptions(cell.value)
-                if cleaned != cell.value:
-                    cell.value = cleaned
+def fix_aly_sheet(rows: Iterable[Sequence]) -> Iterator[Sequence]:
+    return map_text_cells(rows, fix_aly_descriptions)
 
 
-def prefix_summary(text: str, prefix: str, keywords: Sequence[str]) -> str:
-    raw = text or ""
-    if contains_any(raw, keywords):
-        return raw
-    if not raw:
-        return prefix
-    return cleanup(f"{prefix}；{raw}")
+def is_blank(value) -> bool:
+    # Same result as `not str(value or "").strip()` without building stripped copies
+    if not value:
+        return True
+    return isinstance(value, str) and value.isspace()
 
 
-def prefix_short(text: str, prefix: str, keywords: Sequence[str]) -> str:
-    raw = text or ""
-    if contains_any(raw, keywords):
-        return raw
-    if not raw:
-        return prefix
-    return cleanup(f"{prefix}；{raw}")
+def is_empty_slot(value) -> bool:
+    # Stricter than is_blank on purpose: a disease slot holding 0/False is kept
+    # as existing content, as the slot check always has; only None or
+    # whitespace-only text counts as a free slot.
+    return value is None or (isinstance(value, str) and (not value or value.isspace()))
 
 
-def prefix_interpretation(text: str, prefix: str, keywords: Sequence[str]) -> str:
-    raw = text or ""
-    if contains_any(raw, keywords):
+@lru_cache(maxsize=4096)
+def prefix_text(raw: str, prefix: str, already: bool, sep: str) -> str:
+    # Cached: empty cells and repeated boilerplate recur across many rows
+    if already:
         return raw
     if not raw:
         return prefix
-    return cleanup(f"{prefix} {raw}")
+    return cleanup(f"{prefix}{sep}{raw}")
 
 
 def insert_disease(
-    row,
+    row: List,
     start_col: int,
     name: str,
     probability: str,
@@ -267,138 +293,154 @@ def insert_disease(
     priority: int,
     keywords: Sequence[str],
 ) -> None:
-    def get_slot(offset: int):
-        base = start_col + offset * 3
-        return row[base], row[base + 1], row[base + 2]
-
-    def is_empty(cell):
-        return cell.value is None or (isinstance(cell.value, str) and not cell.value.strip())
+    def slot(offset: int) -> int:
+        return start_col + offset * 3
 
     # Already present
-    slot_values = [get_slot(0)[0].value, get_slot(1)[0].value, get_slot(2)[0].value]
+    slot_values = [row[slot(0)], row[slot(1)], row[slot(2)]]
     if any(isinstance(val, str) and contains_any(val, keywords) for val in slot_values):
         return
 
     if priority == 1:
-        # Shift down to make room at slot1
-        slot3 = get_slot(2)
-        slot2 = get_slot(1)
-        slot1 = get_slot(0)
-
-        dropped = (slot3[0].value, slot3[1].value, slot3[2].value)
-
-        slot3[0].value, slot3[1].value, slot3[2].value = (
-            slot2[0].value,
-            slot2[1].value,
-            slot2[2].value,
-        )
-        slot2[0].value, slot2[1].value, slot2[2].value = (
-            slot1[0].value,
-            slot1[1].value,
-            slot1[2].value,
-        )
-        slot1[0].value = name
-        slot1[1].value = probability
-        slot1[2].value = analysis
+        # Shift slots 1-2 down to make room at slot1; slot3 falls off the end
+        end = slot(3)
+        dropped_analysis = row[end - 1]
+        row[slot(1):end] = row[slot(0):slot(2)]
+        row[slot(0):slot(1)] = (name, probability, analysis)
 
         # Preserve dropped info by appending to slot3 analysis
-        if any(dropped):
-            tail = slot3[2].value or ""
-            extra = dropped[2] or ""
-            if extra:
-                slot3[2].value = cleanup(f"{tail}；{extra}") if tail else extra
+        if dropped_analysis:
+            tail = row[end - 1]
+            row[end - 1] = cleanup(f"{tail}；{dropped_analysis}") if tail else dropped_analysis
         return
 
     # Priority 2: fill first empty slot, else append analysis
     for offset in range(3):
-        name_cell, prob_cell, analysis_cell = get_slot(offset)
-        if is_empty(name_cell):
-            name_cell.value = name
-            prob_cell.value = probability
-            analysis_cell.value = analysis
+        base = slot(offset)
+        if is_empty_slot(row[base]):
+            row[base] = name
+            row[base + 1] = probability
+            row[base + 2] = analysis
             return
 
-    analysis_cell = get_slot(2)[2]
-    analysis_cell.value = cleanup(f"{analysis_cell.value}；{analysis}") if analysis_cell.value else analysis
-
-
-def update_sheet(ws, awbc_config, srbc_config) -> None:
-    headers = [cell.value for cell in ws[1]]
-
-    awbc_col = headers.index("AWBC#") + 1 if "AWBC#" in headers else None
-    srbc_col = headers.index("SRBC#") + 1 if "SRBC#" in headers else None
-
-    summary1_col = headers.index("总结1") + 1 if "总结1" in headers else None
-    summary2_col = headers.index("总结2") + 1 if "总结2" in headers else None
-    interp_col = headers.index("解读") + 1 if "解读" in headers else None
-    disease1_col = headers.index("可能疾病1") + 1 if "可能疾病1" in headers else None
-
-    for row in ws.iter_rows(min_row=3, max_row=ws.max_row):
-        if awbc_col:
-            status = row[awbc_col - 1].value
-            if status == "↑":
-                prompt_cell = row[awbc_col] if awbc_col < len(row) else None
-                basis_cell = row[awbc_col + 1] if awbc_col + 1 < len(row) else None
-                if prompt_cell and not str(prompt_cell.value or "").strip():
-                    prompt_cell.value = awbc_config["prompt"]
-                if basis_cell and not str(basis_cell.value or "").strip():
-                    basis_cell.value = awbc_config["basis"]
-
-                keywords = awbc_config["disease"]["keywords"]
-                if summary1_col:
-                    cell = row[summary1_col - 1]
-                    cell.value = prefix_summary(str(cell.value or ""), awbc_config["prompt"], keywords)
-                if summary2_col:
-                    cell = row[summary2_col - 1]
-                    cell.value = prefix_short(str(cell.value or ""), awbc_config["short"], keywords)
-                if interp_col:
-                    cell = row[interp_col - 1]
-                    cell.value = prefix_interpretation(
-                        str(cell.value or ""), awbc_config["interpretation"], keywords
-                    )
-                if disease1_col:
-                    insert_disease(
-                        row,
-                        disease1_col - 1,
-                        awbc_config["disease"]["name"],
-                        awbc_config["disease"]["probability"],
-                        awbc_config["disease"]["analysis"],
-                        awbc_config["disease"]["priority"],
-                        keywords,
-                    )
-
-        if srbc_col:
-            status = row[srbc_col - 1].value
-            if status == "↑":
-                prompt_cell = row[srbc_col] if srbc_col < len(row) else None
-                basis_cell = row[srbc_col + 1] if srbc_col + 1 < len(row) else None
-                if prompt_cell and not str(prompt_cell.value or "").strip():
-                    prompt_cell.value = srbc_config["prompt"]
-                if basis_cell and not str(basis_cell.value or "").strip():
-                    basis_cell.value = srbc_config["basis"]
-
-                keywords = srbc_config["disease"]["keywords"]
-                if summary1_col:
-                    cell = row[summary1_col - 1]
-                    cell.value = prefix_summary(str(cell.value or ""), srbc_config["prompt"], keywords)
-                if summary2_col:
-                    cell = row[summary2_col - 1]
-                    cell.value = prefix_short(str(cell.value or ""), srbc_config["short"], keywords)
-                if interp_col:
-                    cell = row[interp_col - 1]
-                    cell.value = prefix_interpretation(
-                        str(cell.value or ""), srbc_config["interpretation"], keywords
-                    )
-                if disease1_col:
-                    insert_disease(
-                        row,
-                        disease1_col - 1,
-                        srbc_config["disease"]["name"],
-                        srbc_config["disease"]["probability"],
-                        srbc_config["disease"]["analysis"],
-                        srbc_config["disease"]["priority"],
-                        keywords,
-                    )
+    base = slot(2)
+    row[base + 2] = cleanup(f"{row[base + 2]}；{analysis}") if row[base + 2] else analysis
+
+
+def index_headers(headers: Sequence) -> Dict[str, int]:
+    # Single pass over the header row; duplicate headers resolve to the first
+    # occurrence, matching the old list.index lookups.
+    column_index: Dict[str, int] = {}
+    for index, header in enumerate(headers):
+        if header is not None:
+            column_index.setdefault(header, index)
+    return column_index
+
+
+def update_sheet(rows: Iterable[Sequence], awbc_config, srbc_config) -> Iterator[Sequence]:
+    rows = iter(rows)
+    header_row = next(rows, None)
+    if header_row is None:
+        return
+    headers = list(header_row)
+    yield headers
+    # Second header row (merged sub-headers) passes through untouched
+    sub_headers = next(rows, None)
+    if sub_headers is None:
+        return
+    yield list(sub_headers)
+
+    column_index = index_headers(headers)
+
+    awbc_col = column_index.get("AWBC#")
+    srbc_col = column_index.get("SRBC#")
+
+    summary1_col = column_index.get("总结1")
+    summary2_col = column_index.get("总结2")
+    interp_col = column_index.get("解读")
+    disease1_col = column_index.get("可能疾病1")
+
+    # Only status columns present in this sheet are checked per row; config
+    # fields are unpacked here so the row loop works on locals only.
+    markers = [
+        (
+            col,
+            config["prompt"],
+            config["basis"],
+            config["short"],
+            config["interpretation"],
+            tuple(config["disease"]["keywords"]),
+            config["disease"]["name"],
+            config["disease"]["probability"],
+            config["disease"]["analysis"],
+            config["disease"]["priority"],
+        )
+        for col, config in ((awbc_col, awbc_config), (srbc_col, srbc_config))
+        if col is not None
+    ]
+    if not markers:
+        yield from rows
+        return
+    status_cols = tuple(marker[0] for marker in markers)
+
+    # Rows read without a trusted dimension can be ragged; pad flagged rows far
+    # enough to cover the header and all three disease slots.
+    width = len(headers)
+    if disease1_col is not None:
+        width = max(width, disease1_col + 9)
+    for values in rows:
+        if not any(col < len(values) and values[col] == "↑" for col in status_cols):
+            yield values
+            continue
+
+        row = list(values)
+        if len(row) < width:
+            row.extend([None] * (width - len(row)))
+
+        for (
+            status_col,
+            prompt,
+            basis,
+            short,
+            interpretation,
+            keywords,
+            disease_name,
+            disease_probability,
+            disease_analysis,
+            disease_priority,
+        ) in markers:
+            if row[status_col] != "↑":
+                continue
+            prompt_col = status_col + 1
+            basis_col = status_col + 2
+            if prompt_col < len(row) and is_blank(row[prompt_col]):
+                row[prompt_col] = prompt
+            if basis_col < len(row) and is_blank(row[basis_col]):
+                row[basis_col] = basis
+
+            if summary1_col is not None:
+                raw = str(row[summary1_col] or "")
+                row[summary1_col] = prefix_text(raw, prompt, contains_any(raw, keywords), "；")
+            if summary2_col is not None:
+                raw = str(row[summary2_col] or "")
+                row[summary2_col] = prefix_text(raw, short, contains_any(raw, keywords), "；")
+            if interp_col is not None:
+                raw = str(row[interp_col] or "")
+                row[interp_col] = prefix_text(
+                    raw, interpretation, contains_any(raw, keywords), " "
+                )
+            if disease1_col is not None:
+                insert_disease(
+                    row,
+                    disease1_col,
+                    disease_name,
+                    disease_probability,
+                    disease_analysis,
+                    disease_priority,
+                    keywords,
+                )
+
+        yield row
 
 
 def resolve_output_path(input_path: Path, output_path: Optional[Path]) -> Path:
@@ -409,6 +451,40 @@ def resolve_output_path(input_path: Path, output_path: Optional[Path]) -> Path:
     )
 
 
+def sheet_rows(ws) -> Iterator[Tuple]:
+    # Read-only worksheets stop at the <dimension> recorded in the file, which some
+    # writers leave stale; resetting it makes iter_rows read until the data ends.
+    # No max_row bound is passed, so ws.max_row is never computed.
+    ws.reset_dimensions()
+    return ws.iter_rows(values_only=True)
+
+
+def process_sheet(rows: Iterable[Sequence], args: argparse.Namespace) -> Iterator[Sequence]:
+    if not args.skip_awbc_srbc:
+        awbc_config, srbc_config = CONFIG_PROFILES[args.profile]
+        rows = update_sheet(rows, awbc_config, srbc_config)
+    if args.cleanup_english:
+        rows = cleanup_english_sheet(rows)
+    if args.fix_aly:
+        rows = fix_aly_sheet(rows)
+    return iter(rows)
+
+
+def process_sheet_values(values: List[Sequence], args: argparse.Namespace) -> List[Sequence]:
+    return list(process_sheet(values, args))
+
+
+def save_workbook(sheets: Iterable[Tuple[str, Iterable[Sequence]]], output_path: Path) -> None:
+    # Stays on openpyxl's write-only workbook: bulk writers such as pyexcelerate's
+    # new_sheet(data=...) drop date formats and write error values as plain text.
+    workbook = Workbook(write_only=True)
+    for title, rows in sheets:
+        dest_ws = workbook.create_sheet(title)
+        for row in rows:
+            dest_ws.append(row)
+    workbook.save(output_path)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Update AWBC/SRBC prompts and interpretations in Excel sheets."
@@ -436,7 +512,15 @@ def main() -> None:
         action="store_true",
         help="Skip AWBC/SRBC prompt updates; useful for cleanup-only runs.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for multi-sheet files (default: CPU count; 1 disables).",
+    )
     args = parser.parse_args()
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
 
     input_path = Path(args.input).expanduser()
     if not input_path.exists():
@@ -445,17 +529,28 @@ def main() -> None:
         input_path, Path(args.output).expanduser() if args.output else None
     )
 
-    wb = load_workbook(input_path)
-    for ws in wb.worksheets:
-        if not args.skip_awbc_srbc:
-            awbc_config, srbc_config = CONFIG_PROFILES[args.profile]
-            update_sheet(ws, awbc_config, srbc_config)
-        if args.cleanup_english:
-            cleanup_english_sheet(ws)
-        if args.fix_aly:
-            fix_aly_sheet(ws)
-
-    wb.save(output_path)
+    # Only cell values are carried over (styles and merged ranges are not preserved).
+    source = load_workbook(input_path, read_only=True)
+    try:
+        worksheets = source.worksheets
+        workers = args.workers or os.cpu_count() or 1
+        if workers == 1 or len(worksheets) < 2:
+            # Stream rows straight from the read-only source into the output sink
+            save_workbook(
+                ((ws.title, process_sheet(sheet_rows(ws), args)) for ws in worksheets),
+                output_path,
+            )
+        else:
+            # Sheets are independent, so each one is transformed in its own process;
+            # this holds every sheet in memory, unlike the streaming path above.
+            titles = [ws.title for ws in worksheets]
+            sheet_values = [list(sheet_rows(ws)) for ws in worksheets]
+            with ProcessPoolExecutor(max_workers=min(workers, len(worksheets))) as executor:
+                results = executor.map(process_sheet_values, sheet_values, repeat(args))
+                save_workbook(zip(titles, results), output_path)
+    finally:
+        source.close()
+
     print(f"Saved: {output_path}")
 
 